@@ -5,6 +5,11 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from views import (
+    INDICATORS, SCENARIOS, overview_metrics, year_bounds,
+    trend_series, forecast_series, projection_series,
+)
+
 class FinancialInclusionDashboard:
     def __init__(self, data, forecasts, association_matrix):
         self.data = data
@@ -16,50 +21,45 @@ class FinancialInclusionDashboard:
         st.title("Financial Inclusion Dashboard - Overview")
         st.markdown("### Key Metrics")
         # Example metrics cards
-        access_latest = self.data[self.data['indicator']=='ACCESS']['value_numeric'].iloc[-1]
-        usage_latest = self.data[self.data['indicator']=='USAGE']['value_numeric'].iloc[-1]
-        st.metric("Account Ownership (ACCESS)", f"{access_latest}%")
-        st.metric("Digital Payment Usage (USAGE)", f"{usage_latest}%")
+        metrics = overview_metrics(self.data)
+        for indicator, label in [("ACCESS", "Account Ownership (ACCESS)"), ("USAGE", "Digital Payment Usage (USAGE)")]:
+            latest = metrics[indicator]['latest']
+            st.metric(label, "n/a" if latest is None else f"{latest}%")
         
         st.markdown("### Growth Highlights")
         # Compute simple growth rates
-        self.data['fiscal_year'] = pd.to_numeric(self.data['fiscal_year'], errors='coerce')
-        growth_access = self.data[self.data['indicator']=='ACCESS']['value_numeric'].pct_change().iloc[-1]*100
-        growth_usage = self.data[self.data['indicator']=='USAGE']['value_numeric'].pct_change().iloc[-1]*100
-        st.metric("ACCESS Growth Rate", f"{growth_access:.2f}%")
-        st.metric("USAGE Growth Rate", f"{growth_usage:.2f}%")
+        for indicator in INDICATORS:
+            growth = metrics[indicator]['growth']
+            st.metric(f"{indicator} Growth Rate", "n/a" if growth is None else f"{growth:.2f}%")
     
     # ---------------- Trends Page ----------------
     def trends_page(self):
         st.title("Trends Over Time")
-        indicator = st.selectbox("Select Indicator", ["ACCESS","USAGE"])
-        df = self.data[self.data['indicator']==indicator]
-        date_min = df['fiscal_year'].min()
-        date_max = df['fiscal_year'].max()
-        selected_range = st.slider("Select Year Range", int(date_min), int(date_max), (int(date_min), int(date_max)))
-        df_filtered = df[(df['fiscal_year']>=selected_range[0]) & (df['fiscal_year']<=selected_range[1])]
+        indicator = st.selectbox("Select Indicator", INDICATORS)
+        bounds = year_bounds(self.data, indicator)
+        if bounds is None:
+            st.warning(f"No {indicator} data available.")
+            return
+        date_min, date_max = bounds
+        selected_range = st.slider("Select Year Range", date_min, date_max, (date_min, date_max))
         
-        st.line_chart(df_filtered.set_index('fiscal_year')['value_numeric'])
+        st.line_chart(trend_series(self.data, indicator, selected_range))
     
     # ---------------- Forecasts Page ----------------
     def forecasts_page(self):
         st.title("Forecasts")
-        scenario = st.selectbox("Scenario", ["Base","Optimistic","Pessimistic"])
-        for indicator, df in self.forecasts.items():
+        scenario = st.selectbox("Scenario", SCENARIOS)
+        for indicator, values in forecast_series(self.forecasts, scenario).items():
             st.subheader(f"{indicator} Forecast - {scenario} Scenario")
-            forecast_df = df[scenario]
-            st.line_chart(forecast_df.set_index('fiscal_year')['value_with_events'])
+            st.line_chart(values)
     
     # ---------------- Inclusion Projections Page ----------------
     def projections_page(self):
         st.title("Financial Inclusion Projections")
-        target = 60
-        scenario = st.selectbox("Scenario", ["Base","Optimistic","Pessimistic"], key="proj_scenario")
-        for indicator, df in self.forecasts.items():
-            forecast_df = df[scenario]
+        scenario = st.selectbox("Scenario", SCENARIOS, key="proj_scenario")
+        for indicator, progress in projection_series(self.forecasts, scenario).items():
             st.subheader(f"{indicator} Projection - {scenario}")
-            forecast_df['progress'] = forecast_df['value_with_events']/target*100
-            st.bar_chart(forecast_df.set_index('fiscal_year')['progress'])
+            st.bar_chart(progress)
     
     # ---------------- Main Runner ----------------
     def run(self):
@@ -0,0 +1,202 @@
+# dashboard/export.py
+# Pre-render every dashboard page/indicator/scenario into a static HTML/JSON
+# bundle that a plain file server can host.
+#
+#   python dashboard/export.py --out site/ --workers 4
+#
+# Each combination is keyed by a hash of its page data and this module's
+# source; unchanged combinations are skipped on re-export.
+
+import argparse
+import hashlib
+import html
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations_with_replacement
+from pathlib import Path
+
+import pandas as pd
+
+from views import (
+    INDICATORS, SCENARIOS, PROJECTION_TARGET, overview_metrics, year_bounds,
+    trend_series, forecast_series, projection_series,
+)
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+RENDER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+
+
+def _series_payload(series):
+    return {'x': [int(x) for x in series.index], 'y': [None if pd.isna(y) else float(y) for y in series.values]}
+
+
+def _number(value):
+    return None if value is None or pd.isna(value) else float(value)
+
+
+# ---------------- Page Payloads ----------------
+def build_jobs(data, forecasts, year_ranges=None):
+    """
+    One job per page/indicator/scenario/year-range combination:
+    (relative path without extension, page kind, title, payload)
+    """
+    jobs = []
+
+    metrics = overview_metrics(data)
+    jobs.append(("overview/index", "overview", "Financial Inclusion Dashboard - Overview", {
+        indicator: {'latest': _number(m['latest']), 'growth': _number(m['growth'])}
+        for indicator, m in metrics.items()
+    }))
+
+    for indicator in INDICATORS:
+        bounds = year_bounds(data, indicator)
+        if bounds is None:
+            continue
+        ranges = year_ranges
+        if ranges is None:
+            years = sorted(trend_series(data, indicator).index.dropna().astype(int).unique())
+            ranges = list(combinations_with_replacement(years, 2))
+        for lo, hi in ranges:
+            jobs.append((f"trends/{indicator}_{lo}_{hi}", "line", f"{indicator} Trend {lo}-{hi}", {
+                indicator: _series_payload(trend_series(data, indicator, (lo, hi)))
+            }))
+
+    for scenario in SCENARIOS:
+        jobs.append((f"forecasts/{scenario}", "line", f"Forecasts - {scenario} Scenario", {
+            indicator: _series_payload(values)
+            for indicator, values in forecast_series(forecasts, scenario).items()
+        }))
+        jobs.append((f"projections/{scenario}", "bar", f"Progress to {PROJECTION_TARGET}% - {scenario}", {
+            indicator: _series_payload(values)
+            for indicator, values in projection_series(forecasts, scenario).items()
+        }))
+    return jobs
+
+
+def job_hash(job):
+    path, kind, title, payload = job
+    blob = json.dumps([RENDER_VERSION, path, kind, title, payload], sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+# ---------------- Rendering ----------------
+def _render_svg(kind, title, payload):
+    import io
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 4))
+    for i, (label, series) in enumerate(payload.items()):
+        if kind == "bar":
+            width = 0.8 / max(len(payload), 1)
+            ax.bar([x + i*width for x in series['x']], series['y'], width=width, label=label)
+        else:
+            ax.plot(series['x'], series['y'], marker='o', label=label)
+    ax.set_title(title)
+    ax.set_xlabel("Year")
+    ax.grid(True, alpha=0.3)
+    if payload:
+        ax.legend()
+    buf = io.StringIO()
+    fig.savefig(buf, format="svg", bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def render_job(job, out_dir):
+    """
+    Write <path>.json and <path>.html for one combination
+    """
+    path, kind, title, payload = job
+    target = Path(out_dir) / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.with_suffix(".json").write_text(json.dumps({'title': title, 'data': payload}, indent=2))
+
+    if kind == "overview":
+        cards = ""
+        for indicator, m in payload.items():
+            latest = "n/a" if m['latest'] is None else f"{m['latest']}%"
+            growth = "n/a" if m['growth'] is None else f"{m['growth']:.2f}%"
+            cards += (f"<div class='card'><h3>{html.escape(indicator)}</h3>"
+                      f"<p>Latest: {latest}</p><p>Growth: {growth}</p></div>")
+        body = f"<section class='cards'>{cards}</section>"
+    else:
+        body = _render_svg(kind, title, payload)
+
+    depth = "../" * (len(Path(path).parts) - 1)
+    target.with_suffix(".html").write_text(
+        f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+        f"<link rel='stylesheet' href='{depth}style.css'></head><body>"
+        f"<a href='{depth}index.html'>&larr; All pages</a><h1>{html.escape(title)}</h1>{body}"
+        f"<p><a href='{Path(path).name}.json'>Data (JSON)</a></p></body></html>"
+    )
+    return path
+
+
+def _write_index(jobs, out_dir):
+    sections = {}
+    for path, _, title, _ in jobs:
+        sections.setdefault(path.split("/")[0], []).append(
+            f"<li><a href='{path}.html'>{html.escape(title)}</a></li>"
+        )
+    body = "".join(
+        f"<h2>{name.title()}</h2><ul>{''.join(items)}</ul>" for name, items in sections.items()
+    )
+    out_dir = Path(out_dir)
+    (out_dir / "index.html").write_text(
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Financial Inclusion Dashboard</title>"
+        f"<link rel='stylesheet' href='style.css'></head><body><h1>Financial Inclusion Dashboard</h1>{body}</body></html>"
+    )
+    (out_dir / "style.css").write_text(
+        "body{font-family:sans-serif;max-width:960px;margin:2em auto}"
+        ".cards{display:flex;gap:1em}.card{border:1px solid #ddd;padding:1em;border-radius:6px}"
+    )
+
+
+# ---------------- Export ----------------
+def export_dashboard(data, forecasts, out_dir, year_ranges=None, workers=None):
+    """
+    Render changed combinations in parallel and return (rendered, skipped) paths
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / "manifest.json"
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    jobs = build_jobs(data, forecasts, year_ranges)
+    hashes = {job[0]: job_hash(job) for job in jobs}
+    todo = [
+        job for job in jobs
+        if manifest.get(job[0]) != hashes[job[0]] or not (out_dir / job[0]).with_suffix(".html").exists()
+    ]
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(todo) or 1))
+    if workers == 1:
+        rendered = [render_job(job, out_dir) for job in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(render_job, todo, [out_dir]*len(todo)))
+
+    # combinations that no longer exist must not stay servable
+    for path in set(manifest) - set(hashes):
+        for suffix in (".html", ".json"):
+            (out_dir / path).with_suffix(suffix).unlink(missing_ok=True)
+
+    _write_index(jobs, out_dir)
+    manifest_path.write_text(json.dumps(hashes, indent=2, sort_keys=True))
+    skipped = [job[0] for job in jobs if job[0] not in set(rendered)]
+    print(f"✅ Rendered {len(rendered)} page(s), {len(skipped)} unchanged, bundle in {out_dir}")
+    return rendered, skipped
+
+
+if __name__=="__main__":
+    parser = argparse.ArgumentParser(description="Export the dashboard as static HTML/JSON")
+    parser.add_argument("--out", default=DATA_DIR.parent / "site")
+    parser.add_argument("--data", default=DATA_DIR / "raw" / "ethiopia_fi_unified_data.csv")
+    parser.add_argument("--forecasts", default=DATA_DIR / "forecasts.pkl")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    export_dashboard(pd.read_csv(args.data), pd.read_pickle(args.forecasts), args.out, workers=args.workers)
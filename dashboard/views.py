@@ -0,0 +1,73 @@
+# dashboard/views.py
+# Page data shared by the live Streamlit app and the static export.
+
+import pandas as pd
+
+INDICATORS = ["ACCESS", "USAGE"]
+# same mapping as AccessUsageForecaster.indicator_map
+INDICATOR_NAMES = {"ACCESS": "Account Ownership Rate", "USAGE": "Digital Payment Usage"}
+SCENARIOS = ["Base", "Optimistic", "Pessimistic"]
+PROJECTION_TARGET = 60
+
+
+def indicator_history(data, indicator):
+    """
+    Observed yearly values (mean per fiscal_year) for ACCESS/USAGE
+    """
+    df = data[data['indicator']==INDICATOR_NAMES[indicator]].copy()
+    if 'record_type' in df.columns:
+        df = df[df['record_type']=='observation']
+    df['fiscal_year'] = pd.to_numeric(df['fiscal_year'], errors='coerce')
+    df['value_numeric'] = pd.to_numeric(df['value_numeric'], errors='coerce')
+    df = df.dropna(subset=['fiscal_year', 'value_numeric'])
+    return df.groupby('fiscal_year', as_index=False)['value_numeric'].mean()
+
+
+def overview_metrics(data):
+    """
+    Latest value and last growth rate (%) per indicator; None when missing
+    """
+    metrics = {}
+    for indicator in INDICATORS:
+        values = indicator_history(data, indicator)['value_numeric']
+        latest = values.iloc[-1] if len(values) else None
+        growth = values.pct_change().iloc[-1]*100 if len(values) > 1 else None
+        metrics[indicator] = {'latest': latest, 'growth': growth}
+    return metrics
+
+
+def year_bounds(data, indicator):
+    years = indicator_history(data, indicator)['fiscal_year'].dropna()
+    if years.empty:
+        return None
+    return int(years.min()), int(years.max())
+
+
+def trend_series(data, indicator, year_range=None):
+    """
+    value_numeric by fiscal_year within year_range (inclusive)
+    """
+    df = indicator_history(data, indicator)
+    if year_range is not None:
+        df = df[(df['fiscal_year']>=year_range[0]) & (df['fiscal_year']<=year_range[1])]
+    return df.set_index('fiscal_year')['value_numeric']
+
+
+def forecast_series(forecasts, scenario):
+    """
+    Scenario forecast line per indicator
+    """
+    return {
+        indicator: df[scenario].set_index('fiscal_year')['value_with_events']
+        for indicator, df in forecasts.items()
+    }
+
+
+def projection_series(forecasts, scenario, target=PROJECTION_TARGET):
+    """
+    Progress towards target (%) per indicator
+    """
+    return {
+        indicator: values/target*100
+        for indicator, values in forecast_series(forecasts, scenario).items()
+    }
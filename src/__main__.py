@@ -0,0 +1,200 @@
+"""
+Headless batch run of the event model and forecasts.
+
+    python -m src --config runs.json --output-dir outputs/ --workers 4
+
+The config is JSON; every spec picks an indicator, an event set and the
+scenarios to produce:
+
+    {
+      "start_year": 2025,
+      "end_year": 2027,
+      "event_sets": {"mobile_money": ["Telebirr Launch", "M-Pesa EthSwitch Integration"]},
+      "specs": [
+        {"name": "usage_mm", "indicator": "USAGE", "event_set": "mobile_money",
+         "scenarios": ["Base", "Optimistic"], "interval": "bootstrap"},
+        {"name": "access_stress", "indicator": "ACCESS",
+         "events": ["Telebirr Launch"], "scenarios": {"Stress": 0.25},
+         "trend": "drivers", "driver_options": {"lags": [0, 1, 2]}}
+      ]
+    }
+
+Without --config the notebook event sets (src.pipeline.DEFAULT_FORECAST_SPECS)
+are run with all scenarios.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from src.forecasting import AccessUsageForecaster
+from src.pipeline import DATA_DIR, DEFAULT_FORECAST_SPECS, build_pipeline
+
+
+_SHARED = {}
+
+CONFIG_KEYS = {"start_year", "end_year", "interval", "event_sets", "specs"}
+
+
+def load_specs(config):
+    """
+    Expand a config dict into self-contained run specs
+    """
+    unknown = set(config) - CONFIG_KEYS
+    if unknown:
+        raise ValueError(f"Config has unknown keys {sorted(unknown)}; expected {sorted(CONFIG_KEYS)}")
+    if not config.get("specs"):
+        raise ValueError("Config has no 'specs' to run")
+
+    event_sets = config.get("event_sets", {})
+    specs = []
+    for i, spec in enumerate(config.get("specs", [])):
+        spec = dict(spec)
+        if "indicator" not in spec:
+            raise ValueError(f"Spec {i} has no 'indicator'")
+        if "event_set" in spec:
+            if spec["event_set"] not in event_sets:
+                raise ValueError(f"Spec {i} uses unknown event_set '{spec['event_set']}'")
+            spec["events"] = event_sets[spec.pop("event_set")]
+        spec.setdefault("name", f"{spec['indicator'].lower()}_{i}")
+        spec.setdefault("events", [])
+        spec.setdefault("start_year", config.get("start_year", 2025))
+        spec.setdefault("end_year", config.get("end_year", 2027))
+        spec.setdefault("interval", config.get("interval", "normal"))
+        specs.append(spec)
+
+    names = [spec["name"] for spec in specs]
+    if len(set(names)) != len(names):
+        raise ValueError("Spec names must be unique; they name the output folders")
+    return specs
+
+
+def check_specs(specs, forecaster):
+    """
+    Fail before any worker starts when a spec names an unknown indicator or event
+    """
+    known_events = set(forecaster.association_matrix.index)
+    for spec in specs:
+        if spec["indicator"] not in forecaster.indicator_map:
+            raise ValueError(
+                f"Spec '{spec['name']}' has unknown indicator '{spec['indicator']}'; "
+                f"expected one of {sorted(forecaster.indicator_map)}"
+            )
+        unknown = set(spec["events"]) - known_events
+        if unknown:
+            raise ValueError(f"Spec '{spec['name']}' has unknown events {sorted(unknown)}")
+
+
+def default_specs():
+    return [
+        {"name": indicator.lower(), "indicator": indicator, "events": events,
+         "start_year": 2025, "end_year": 2027, "interval": "normal"}
+        for indicator, events in DEFAULT_FORECAST_SPECS.items()
+    ]
+
+
+def _init_worker(data, tables):
+    _SHARED["data"] = data
+    _SHARED["tables"] = tables
+
+
+def run_spec(spec, output_dir, plots=False):
+    """
+    Forecast one spec and write its artifacts to output_dir/<name>/
+    """
+    tables = _SHARED["tables"]
+    lag_kwargs = {}
+    if spec.get("use_lags"):
+        lag_kwargs = {"lag_matrix": tables["lag_matrix"], "event_dates": tables["event_dates"]}
+    forecaster = AccessUsageForecaster(_SHARED["data"], tables["association_matrix"], **lag_kwargs)
+
+    scenarios = spec.get("scenarios")
+    if isinstance(scenarios, dict):
+        forecaster.scenario_scaling = {name: float(scale) for name, scale in scenarios.items()}
+    elif scenarios:
+        unknown = set(scenarios) - set(forecaster.scenario_scaling)
+        if unknown:
+            raise ValueError(f"Spec '{spec['name']}' has unknown scenarios {sorted(unknown)}")
+        forecaster.scenario_scaling = {name: forecaster.scenario_scaling[name] for name in scenarios}
+
+    result = forecaster.forecast(
+        spec["indicator"], spec["events"], spec["start_year"], spec["end_year"],
+        interval=spec["interval"], random_state=spec.get("random_state"),
+        trend=spec.get("trend", "linear"), driver_options=spec.get("driver_options"),
+    )
+
+    spec_dir = Path(output_dir) / spec["name"]
+    spec_dir.mkdir(parents=True, exist_ok=True)
+    result["forecast_df"].to_csv(spec_dir / "forecast.csv", index=False)
+    scenario_df = pd.concat(
+        {name: df[['fiscal_year', 'value_with_events']] for name, df in result["scenarios"].items()},
+        names=["scenario"]
+    ).reset_index(level=0)
+    scenario_df.to_csv(spec_dir / "scenarios.csv", index=False)
+    pd.to_pickle(result, spec_dir / "result.pkl")
+
+    if plots:
+        import matplotlib
+        matplotlib.use("Agg")
+        forecaster.plot_forecast(spec["indicator"], save_path=spec_dir / "forecast.png")
+
+    return {"name": spec["name"], "indicator": spec["indicator"], "output": str(spec_dir)}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src", description="Batch forecasting run")
+    parser.add_argument("--config", help="JSON file with event_sets and specs")
+    parser.add_argument("--output-dir", default="outputs", help="Directory for run artifacts")
+    parser.add_argument("--data", default=DATA_DIR / "raw" / "ethiopia_fi_unified_data.csv")
+    parser.add_argument("--impact", default=DATA_DIR / "raw" / "Impact_sheet.csv")
+    parser.add_argument("--cache-dir", default=DATA_DIR / ".cache")
+    parser.add_argument("--aliases", default=DATA_DIR / "aliases.csv",
+                        help="Persisted alias table for name resolution")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (1 runs in-process)")
+    parser.add_argument("--plots", action="store_true", help="Also save forecast PNGs")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.time()
+
+    if args.config:
+        with open(args.config) as f:
+            specs = load_specs(json.load(f))
+    else:
+        specs = default_specs()
+
+    pipeline = build_pipeline(args.data, args.impact, args.cache_dir, alias_path=args.aliases)
+    upstream = pipeline.run(targets=["records", "tables"])
+    data, tables = upstream["records"]["data"], upstream["tables"]
+    check_specs(specs, AccessUsageForecaster(data, tables["association_matrix"]))
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(args.workers, len(specs)))
+
+    if workers == 1:
+        _init_worker(data, tables)
+        runs = [run_spec(spec, output_dir, args.plots) for spec in specs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data, tables)) as pool:
+            futures = [pool.submit(run_spec, spec, output_dir, args.plots) for spec in specs]
+            runs = [future.result() for future in futures]
+
+    pd.to_pickle(tables["association_matrix"], output_dir / "association_matrix.pkl")
+    with open(output_dir / "manifest.json", "w") as f:
+        json.dump({"specs": specs, "runs": runs}, f, indent=2, default=str)
+
+    print(f"✅ {len(runs)} forecast spec(s) written to {output_dir} in {time.time() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+import pandas as pd
+import numpy as np
+
+
+# Leading indicators named in eda.infrastructure_analysis
+DEFAULT_DRIVERS = [
+    '4G Population Coverage',
+    'Mobile Subscription Penetration',
+    'ATM/100k Population',
+]
+
+
+class DriverModel:
+    """
+    Distributed-lag ridge regression of an indicator on infrastructure drivers:
+
+        y_t = a + sum_d sum_{l<=L} b_{d,l} * x_{d,t-l}
+
+    The (max lag L, ridge alpha) grid is searched by leave-one-out error.
+    The lagged design and its Gram matrix are built once for the largest lag;
+    each smaller lag uses a leading block of that Gram, is eigendecomposed
+    once, and all alphas are then solved together.
+
+    Follows the sklearn fit/predict interface on a (n, 1) array of years so it
+    can stand in for the LinearRegression returned by fit_trend.
+    """
+
+    def __init__(self, data, drivers=None, lags=(0, 1, 2), alphas=(0.01, 0.1, 1.0, 10.0, 100.0), driver_paths=None):
+        self.data = data
+        self.drivers = list(DEFAULT_DRIVERS if drivers is None else drivers)
+        self.lags = sorted(lags)
+        self.alphas = np.asarray(alphas, dtype=float)
+        # optional future/override driver values: DataFrame indexed by year, one column per driver
+        self.driver_paths = driver_paths
+        self.observed = self._observed_drivers()
+
+    def _observed_drivers(self):
+        df = self.data[self.data['indicator'].isin(self.drivers)].copy()
+        df['year'] = pd.to_datetime(df['observation_date'], errors='coerce').dt.year
+        df['year'] = df['year'].fillna(pd.to_numeric(df['fiscal_year'], errors='coerce'))
+        df['value_numeric'] = pd.to_numeric(df['value_numeric'], errors='coerce')
+        df = df.dropna(subset=['year', 'value_numeric'])
+        observed = df.pivot_table(index='year', columns='indicator', values='value_numeric', aggfunc='mean')
+        if self.driver_paths is not None:
+            observed = self.driver_paths.combine_first(observed)
+        observed.index = observed.index.astype(int)
+        missing = [d for d in self.drivers if d not in observed.columns]
+        if missing:
+            print(f"⚠ Warning: No data for drivers {missing}. They are left out.")
+        return observed[[d for d in self.drivers if d in observed.columns]]
+
+    def driver_panel(self, years):
+        """
+        Driver values for every year in years: linear between observations,
+        held at the nearest observation outside them
+        """
+        years = np.arange(int(min(years)), int(max(years)) + 1)
+        panel = self.observed.reindex(sorted(set(years) | set(self.observed.index)))
+        panel = panel.interpolate(method='index', limit_area='inside').ffill().bfill()
+        return panel.reindex(years)
+
+    def check_coverage(self, years, max_lag):
+        """
+        Warn when lagged driver values are needed outside the observed years;
+        there they are held flat, which makes the fitted trend flat too
+        """
+        if self.driver_paths is not None:
+            return
+        needed = np.unique(np.concatenate([np.asarray(years, dtype=int) - lag for lag in range(max_lag + 1)]))
+        for driver in self.observed.columns:
+            seen = self.observed[driver].dropna().index
+            outside = needed[(needed < seen.min()) | (needed > seen.max())]
+            if len(outside):
+                print(f"⚠ Warning: {driver} observed only {seen.min()}-{seen.max()}; "
+                      f"held constant for {[int(y) for y in outside]}. Pass driver_paths to supply values.")
+
+    def lagged_design(self, years, max_lag):
+        """
+        Columns (lag, driver) ordered by lag, so lags <= L are the leading block
+        """
+        years = np.asarray(years, dtype=int)
+        panel = self.driver_panel(np.concatenate([years - max_lag, years]))
+        blocks = {lag: panel.reindex(years - lag).set_axis(years) for lag in range(max_lag + 1)}
+        return pd.concat(blocks, axis=1, names=['lag', 'driver'])
+
+    def fit(self, X, y):
+        years = np.asarray(X).ravel().astype(int)
+        y = np.asarray(y, dtype=float)
+        max_lag = self.lags[-1]
+        p = self.observed.shape[1]
+        self.check_coverage(years, max_lag)
+
+        Z = self.lagged_design(years, max_lag).to_numpy(dtype=float)
+        self.z_mean_ = Z.mean(axis=0)
+        self.z_scale_ = Z.std(axis=0)
+        self.z_scale_[self.z_scale_ == 0] = 1.0
+        Zs = (Z - self.z_mean_) / self.z_scale_
+        self.intercept_ = y.mean()
+        yc = y - self.intercept_
+
+        # built once for the largest lag; every configuration reuses a leading block
+        G = Zs.T @ Zs
+        b = Zs.T @ yc
+
+        results, coefs = [], {}
+        for lag in self.lags:
+            k = (lag + 1) * p
+            lam, V = np.linalg.eigh(G[:k, :k])
+            lam = np.clip(lam, 0, None)
+            shrink = 1.0 / (lam[None, :] + self.alphas[:, None])             # (A, k)
+            coef = (shrink * (V.T @ b[:k])[None, :]) @ V.T                     # (A, k)
+            ZV = Zs[:, :k] @ V                                                 # (n, k)
+            # + 1/n for the unpenalized intercept (y is centred)
+            hat = (ZV[None, :, :] ** 2 * shrink[:, None, :]).sum(axis=2) + 1.0 / len(y)  # (A, n)
+            resid = yc[None, :] - coef @ Zs[:, :k].T                           # (A, n)
+            loo = resid / np.maximum(1 - hat, 1e-8)
+            for alpha, c, err in zip(self.alphas, coef, (loo ** 2).mean(axis=1)):
+                results.append({'max_lag': lag, 'alpha': alpha, 'loo_mse': err})
+                coefs[(lag, alpha)] = c
+
+        self.cv_results_ = pd.DataFrame(results)
+        best = self.cv_results_.loc[self.cv_results_['loo_mse'].idxmin()]
+        self.max_lag_ = int(best['max_lag'])
+        self.alpha_ = float(best['alpha'])
+        self.coef_ = coefs[(self.max_lag_, best['alpha'])]
+        k = (self.max_lag_ + 1) * p
+        self.fitted_ = self.intercept_ + Zs[:, :k] @ self.coef_
+        return self
+
+    def predict(self, X):
+        years = np.asarray(X).ravel().astype(int)
+        self.check_coverage(years, self.max_lag_)
+        k = (self.max_lag_ + 1) * self.observed.shape[1]
+        Z = self.lagged_design(years, self.lags[-1]).to_numpy(dtype=float)[:, :k]
+        Zs = (Z - self.z_mean_[:k]) / self.z_scale_[:k]
+        return self.intercept_ + Zs @ self.coef_
+
+    def coefficients(self):
+        """
+        Fitted effects in original driver units, indexed by (lag, driver)
+        """
+        k = (self.max_lag_ + 1) * self.observed.shape[1]
+        index = pd.MultiIndex.from_product(
+            [range(self.max_lag_ + 1), self.observed.columns], names=['lag', 'driver']
+        )
+        return pd.Series(self.coef_ / self.z_scale_[:k], index=index, name='effect')
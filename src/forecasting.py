@@ -1,14 +1,95 @@
 import pandas as pd
 import numpy as np
 from sklearn.linear_model import LinearRegression
-import matplotlib.pyplot as plt
+
+from src.drivers import DriverModel
+
+
+def bootstrap_trend_intervals(hist, years, n_boot=2000, level=0.95, random_state=None, chunk_size=250):
+    """
+    Residual-bootstrap prediction intervals for linear trends, batched over series.
+
+    hist: wide DataFrame (index fiscal_year, one column per series, NaN where
+    a series has no observation). Each replicate resamples every series'
+    residuals, refits all trends with one batched 2x2 solve and adds a
+    resampled residual to the projection, so the bands carry parameter
+    uncertainty and widen with horizon.
+    Returns a long DataFrame: series, fiscal_year, trend_value, ci_lower, ci_upper.
+    Series with two or fewer observed years get NaN bounds.
+    """
+    rng = np.random.default_rng(random_state)
+    x = hist.index.to_numpy(dtype=float)
+    x_ref = x.mean() if len(x) else 0.0
+    Y = hist.to_numpy(dtype=float).T                          # (S, n)
+    W = ~np.isnan(Y)
+    Y = np.where(W, Y, 0.0)
+    counts = W.sum(axis=1)
+
+    X = np.column_stack([np.ones_like(x), x - x_ref])         # (n, 2)
+    G = np.einsum('sn,ni,nj->sij', W.astype(float), X, X)
+    # series with fewer than two years get a flat trend (slope 0), like LinearRegression
+    has_slope = np.column_stack([np.ones(len(counts)), counts >= 2]).astype(float)
+    mask = has_slope[:, :, None] * has_slope[:, None, :]
+    G_inv = np.linalg.inv(G * mask + 1e-8 * np.eye(2)) * mask  # (S, 2, 2)
+    beta = np.einsum('sij,nj,sn->si', G_inv, X, Y)
+
+    fitted = beta @ X.T                                       # (S, n)
+    resid = np.where(W, Y - fitted, 0.0)
+    # inflate residuals for the two fitted parameters
+    resid *= np.where(counts > 2, np.sqrt(counts / np.maximum(counts - 2, 1)), 1.0)[:, None]
+
+    # observed positions first, so positions below counts[s] are real residuals
+    obs_idx = np.argsort(~W, axis=1, kind='stable')
+    n_obs = np.maximum(counts, 1)[None, :, None]
+
+    def resample(b, width):
+        pos = np.floor(rng.random((b, len(counts), width)) * n_obs).astype(int)
+        return np.take_along_axis(resid[None], np.take_along_axis(obs_idx[None], pos, axis=2), axis=2)
+
+    years = np.asarray(years, dtype=float)
+    X_f = np.column_stack([np.ones_like(years), years - x_ref])  # (T, 2)
+
+    draws = []
+    for start in range(0, n_boot, chunk_size):
+        b = min(chunk_size, n_boot - start)
+        Y_star = (fitted[None] + resample(b, len(x))) * W[None]
+        beta_star = np.einsum('sij,nj,bsn->bsi', G_inv, X, Y_star)
+        draws.append(beta_star @ X_f.T + resample(b, len(years)))
+    draws = np.concatenate(draws, axis=0)                     # (B, S, T)
+
+    tail = (1 - level) / 2 * 100
+    lower, upper = np.percentile(draws, [tail, 100 - tail], axis=0)
+    trend = beta @ X_f.T
+
+    # two points or fewer leave no residuals to resample: the band is unknown, not zero-width
+    too_short = counts <= 2
+    if too_short.any():
+        print(f"⚠ Warning: Too few years to bootstrap {list(hist.columns[too_short])}; intervals set to NaN.")
+        lower[too_short] = np.nan
+        upper[too_short] = np.nan
+
+    return pd.DataFrame({
+        'series': np.repeat(hist.columns.to_numpy(), len(years)),
+        'fiscal_year': np.tile(years.astype(int), len(hist.columns)),
+        'trend_value': trend.ravel(),
+        'ci_lower': lower.ravel(),
+        'ci_upper': upper.ravel(),
+    })
+
 
 class AccessUsageForecaster:
-    def __init__(self, original_data, association_matrix):
+    def __init__(self, original_data, association_matrix, lag_matrix=None, event_dates=None, impact_counts=None):
         self.data = original_data
         self.association_matrix = association_matrix
+        # optional Impact_sheet rows per association cell (EventImpactModel.impact_counts)
+        self.impact_counts = impact_counts
+        # optional timing (EventImpactModel.build_lag_matrix); without it events apply to every year
+        self.lag_matrix = lag_matrix
+        self.event_dates = event_dates
         self.indicator_map = {"ACCESS":"Account Ownership Rate", "USAGE":"Digital Payment Usage"}
+        self.scenario_scaling = {'Base':1.0, 'Optimistic':1.5, 'Pessimistic':0.5}
         self.forecast_results = {}
+        self.sensitivity_results = None
 
     def prepare_historical_data(self, indicator):
         indicator_name = self.indicator_map[indicator]
@@ -22,8 +103,8 @@ class AccessUsageForecaster:
         df = df.dropna(subset=['fiscal_year','value_numeric'])
     
         if df.empty:
-           print(f"⚠ Warning: No historical data for {indicator_name}. Using baseline=0.")
-        df = pd.DataFrame({'fiscal_year':[2024], 'value_numeric':[0]})
+            print(f"⚠ Warning: No historical data for {indicator_name}. Using baseline=0.")
+            df = pd.DataFrame({'fiscal_year':[2024], 'value_numeric':[0]})
         
         df = df.groupby('fiscal_year').mean().reset_index()
         df.rename(columns={'value_numeric':'value'}, inplace=True)
@@ -40,42 +121,201 @@ class AccessUsageForecaster:
         residual_std = np.std(y - model.predict(X))
         return model, residual_std
 
+    def fit_drivers(self, hist_df, **driver_options):
+        """
+        Alternative to fit_trend: distributed-lag ridge on infrastructure drivers
+        (see DriverModel for options)
+        """
+        model = DriverModel(self.data, **driver_options)
+        model.fit(hist_df['fiscal_year'].values.reshape(-1,1), hist_df['value'].values)
+        residual_std = np.std(hist_df['value'].values - model.fitted_)
+        return model, residual_std
+
+    def event_activation(self, events, indicators, years, lag_shift=0.0):
+        """
+        Step-function activation array of shape (events, indicators, years).
+        An event is active in a fiscal year once its date plus lag falls
+        before the end of that year.
+        """
+        years = np.asarray(years, dtype=float)
+        if self.lag_matrix is None or self.event_dates is None:
+            return np.ones((len(events), len(indicators), len(years)))
+
+        dates = pd.to_datetime(pd.Series(self.event_dates).reindex(events), errors='coerce')
+        onset = (dates.dt.year + (dates.dt.dayofyear - 1) / 365.25).to_numpy(dtype=float)
+        lags = self.lag_matrix.reindex(index=events, columns=indicators).fillna(0).to_numpy(dtype=float)
+        onset = onset[:, None] + (lags + lag_shift) / 12.0
+        active = onset[:, :, None] < (years + 1)[None, None, :]
+        # events without a known date keep the undated behaviour
+        active[np.isnan(onset)] = True
+        return active.astype(float)
+
     def apply_events(self, forecast_df, indicator, events_to_apply, scaling=1.0):
         assoc = self.association_matrix.reset_index()[['indicator_event', indicator]].copy()
         assoc = assoc[assoc['indicator_event'].isin(events_to_apply)]
         event_impacts = dict(zip(assoc['indicator_event'], assoc[indicator]))
         forecast_df['value_with_events'] = forecast_df['trend_value']
-        for event, impact in event_impacts.items():
+        events = list(event_impacts)
+        active = self.event_activation(events, [indicator], forecast_df['fiscal_year'].values)
+        for i, (event, impact) in enumerate(event_impacts.items()):
             if pd.notna(impact):
-                forecast_df['value_with_events'] += impact * scaling
+                forecast_df['value_with_events'] += impact * scaling * active[i, 0]
         return forecast_df
 
-    def forecast(self, indicator, events_to_apply=[], start_year=2025, end_year=2027):
+    def bootstrap_intervals(self, indicators=None, start_year=2025, end_year=2027, n_boot=2000, level=0.95, random_state=None):
+        """
+        Bootstrap prediction intervals for several indicators in one batched computation.
+        """
+        indicators = list(self.indicator_map) if indicators is None else list(indicators)
+        hist = pd.concat(
+            {ind: self.prepare_historical_data(ind).set_index('fiscal_year')['value'] for ind in indicators},
+            axis=1
+        ).sort_index()
+        years = np.arange(start_year, end_year+1)
+        return bootstrap_trend_intervals(hist, years, n_boot=n_boot, level=level, random_state=random_state)
+
+    def forecast(self, indicator, events_to_apply=[], start_year=2025, end_year=2027, interval='normal', n_boot=2000, random_state=None,
+                 trend='linear', driver_options=None):
+        if trend not in ('linear', 'drivers'):
+            raise ValueError(f"Unknown trend '{trend}'; use 'linear' or 'drivers'")
+        if interval not in ('normal', 'bootstrap'):
+            raise ValueError(f"Unknown interval '{interval}'; use 'normal' or 'bootstrap'")
         hist_df = self.prepare_historical_data(indicator)
-        trend_model, residual_std = self.fit_trend(hist_df)
+        if trend == 'drivers':
+            if interval == 'bootstrap':
+                raise ValueError("Bootstrap intervals are only available for the linear trend")
+            trend_model, residual_std = self.fit_drivers(hist_df, **(driver_options or {}))
+        else:
+            trend_model, residual_std = self.fit_trend(hist_df)
 
         years = np.arange(start_year, end_year+1)
         forecast_df = pd.DataFrame({'fiscal_year': years})
         forecast_df['trend_value'] = trend_model.predict(years.reshape(-1,1))
 
         # confidence interval
-        forecast_df['ci_lower'] = forecast_df['trend_value'] - 1.96*residual_std
-        forecast_df['ci_upper'] = forecast_df['trend_value'] + 1.96*residual_std
+        if interval == 'bootstrap':
+            hist = hist_df.set_index('fiscal_year')[['value']].rename(columns={'value': indicator})
+            bands = bootstrap_trend_intervals(hist, years, n_boot=n_boot, random_state=random_state)
+            forecast_df['ci_lower'] = bands['ci_lower'].values
+            forecast_df['ci_upper'] = bands['ci_upper'].values
+        else:
+            forecast_df['ci_lower'] = forecast_df['trend_value'] - 1.96*residual_std
+            forecast_df['ci_upper'] = forecast_df['trend_value'] + 1.96*residual_std
 
         # scenarios
         scenarios = {}
-        for scenario, scale in [('Base',1.0), ('Optimistic',1.5), ('Pessimistic',0.5)]:
+        for scenario, scale in self.scenario_scaling.items():
             scenarios[scenario] = self.apply_events(forecast_df.copy(), indicator, events_to_apply, scaling=scale)
 
         self.forecast_results[indicator] = {'forecast_df': forecast_df, 'scenarios': scenarios}
         return self.forecast_results[indicator]
 
-    def plot_forecast(self, indicator):
+    def sensitivity(self, events_to_apply=None, indicators=None, start_year=2025, end_year=2027, lag_step_months=12):
+        """
+        Jacobian of scenario forecasts with respect to event impacts and lags.
+
+        The forecast is trend + scaling * sum(impact * activation), so the
+        derivatives are closed-form and need no trend fits or re-runs.
+        Returns a dict of DataFrames indexed by (scenario, indicator, fiscal_year)
+        with one column per event:
+        - 'impact': d forecast / d impact_estimate (pp per pp). With
+          impact_counts this is per Impact_sheet row (a cell is the mean of
+          its rows); without it, per association-matrix cell.
+        - 'lag': change in forecast when the cell's lag grows by
+          lag_step_months (the step function has no continuous lag derivative)
+        - 'rows_per_cell': Impact_sheet rows behind each event/indicator cell
+        """
+        assoc = self.association_matrix
+        events = list(assoc.index) if events_to_apply is None else [e for e in events_to_apply if e in assoc.index]
+        indicators = list(assoc.columns) if indicators is None else list(indicators)
+        years = np.arange(start_year, end_year+1)
+
+        impacts = assoc.reindex(index=events, columns=indicators).to_numpy(dtype=float)  # (E, C)
+        known = ~np.isnan(impacts)
+        impacts = np.nan_to_num(impacts)
+
+        if self.impact_counts is None:
+            print("⚠ Warning: No impact_counts given; impact sensitivities are per association-matrix cell.")
+            counts = known.astype(float)
+        else:
+            counts = self.impact_counts.reindex(index=events, columns=indicators).fillna(0).to_numpy(dtype=float)
+        if self.lag_matrix is None or self.event_dates is None:
+            print("⚠ Warning: No lag_matrix/event_dates given; lag sensitivities are all zero.")
+
+        active = self.event_activation(events, indicators, years)                          # (E, C, T)
+        shifted = self.event_activation(events, indicators, years, lag_shift=lag_step_months)
+        d_impact = active * (known / np.maximum(counts, 1))[:, :, None]
+        d_lag = (shifted - active) * impacts[:, :, None]
+
+        scales = np.array(list(self.scenario_scaling.values()))                             # (S,)
+        # (S, C, T, E) -> rows (scenario, indicator, year), columns events
+        shape = (len(scales) * len(indicators) * len(years), len(events))
+        impact_jac = (scales[:, None, None, None] * d_impact.transpose(1, 2, 0)[None]).reshape(shape)
+        lag_jac = (scales[:, None, None, None] * d_lag.transpose(1, 2, 0)[None]).reshape(shape)
+
+        index = pd.MultiIndex.from_product(
+            [list(self.scenario_scaling), indicators, years],
+            names=['scenario', 'indicator', 'fiscal_year']
+        )
+        columns = pd.Index(events, name='indicator_event')
+        self.sensitivity_results = {
+            'impact': pd.DataFrame(impact_jac, index=index, columns=columns),
+            'lag': pd.DataFrame(lag_jac, index=index, columns=columns),
+            'rows_per_cell': pd.DataFrame(np.maximum(counts, known).T, index=pd.Index(indicators, name='indicator'), columns=columns),
+        }
+        return self.sensitivity_results
+
+    def tornado(self, indicator, scenario='Base', year=None, rel_change=0.2, sensitivity=None):
+        """
+        Rank events by how far a +/- rel_change change in their impact
+        estimate (and a lag_step_months delay) moves one forecast value.
+        """
+        sensitivity = sensitivity or self.sensitivity_results
+        if sensitivity is None:
+            print("Run sensitivity() first")
+            return
+        impact_jac = sensitivity['impact'].loc[(scenario, indicator)]
+        lag_jac = sensitivity['lag'].loc[(scenario, indicator)]
+        year = impact_jac.index.max() if year is None else year
+
+        impacts = self.association_matrix.reindex(index=impact_jac.columns)[indicator].fillna(0)
+        # every Impact_sheet row of the cell moves by rel_change
+        rows = sensitivity['rows_per_cell'].loc[indicator]
+        swing = impact_jac.loc[year] * impacts * rows * rel_change
+        ranking = pd.DataFrame({
+            'impact_estimate': impacts,
+            'impact_down': -swing,
+            'impact_up': swing,
+            'impact_swing': 2 * swing.abs(),
+            'lag_delay_effect': lag_jac.loc[year],
+        })
+        ranking = ranking.reindex(ranking[['impact_swing', 'lag_delay_effect']].abs().max(axis=1).sort_values(ascending=False).index)
+        return ranking
+
+    def plot_tornado(self, indicator, scenario='Base', year=None, rel_change=0.2):
+        ranking = self.tornado(indicator, scenario, year, rel_change)
+        if ranking is None:
+            return
+        ranking = ranking.iloc[::-1]
+        import matplotlib.pyplot as plt
+        plt.figure(figsize=(8, max(3, 0.4*len(ranking))))
+        plt.barh(ranking.index, ranking['impact_up'], color='tab:green', label=f'+{rel_change:.0%} impact')
+        plt.barh(ranking.index, ranking['impact_down'], color='tab:red', label=f'-{rel_change:.0%} impact')
+        plt.axvline(0, color='black', linewidth=0.8)
+        plt.title(f"{indicator} Sensitivity to Event Impacts ({scenario})")
+        plt.xlabel("Change in forecast (pp)")
+        plt.legend()
+        plt.tight_layout()
+        plt.show()
+
+    def plot_forecast(self, indicator, save_path=None):
         results = self.forecast_results.get(indicator)
         if not results:
             print("Run forecast() first")
             return
 
+        # plotting libraries are imported lazily so headless runs start fast
+        import matplotlib.pyplot as plt
         df = results['forecast_df']
         plt.figure(figsize=(8,5))
         plt.plot(df['fiscal_year'], df['trend_value'], marker='o', label='Trend')
@@ -90,7 +330,11 @@ class AccessUsageForecaster:
         plt.ylabel("Percentage")
         plt.legend()
         plt.grid(True)
-        plt.show()
+        if save_path:
+            plt.savefig(save_path, bbox_inches='tight')
+            plt.close()
+        else:
+            plt.show()
 
     def display_table(self, indicator):
         results = self.forecast_results.get(indicator)
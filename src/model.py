@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from src.resolver import target_text
 
 
 class EventImpactModel:
@@ -16,6 +16,9 @@ class EventImpactModel:
         self.events = None
         self.merged = None
         self.association_matrix = None
+        self.impact_counts = None
+        self.lag_matrix = None
+        self.event_dates = None
     
     
     # -----------------------------
@@ -62,6 +65,35 @@ class EventImpactModel:
         print("Events and impacts merged.")
     
     
+    def resolve_names(self, resolver):
+        """
+        Collapse near-duplicate event names and tag impact targets with
+        canonical codes (resolver: src.resolver.IndicatorResolver)
+        """
+        
+        # events and indicators share the code namespace; keep them apart
+        event_codes = resolver.codes_of_type("event")
+        indicator_codes = set(resolver.canonical) - event_codes
+        
+        self.merged["indicator_event"] = resolver.canonicalize(
+            self.merged["indicator_event"], codes=event_codes
+        ).values
+        
+        # related_indicator codes win; free-text targets fill the gaps
+        free_text = self.merged["indicator_impact"].map(target_text)
+        self.merged["target_code"] = (
+            self.merged["related_indicator_impact"]
+            .where(self.merged["related_indicator_impact"].isin(indicator_codes))
+            .fillna(resolver.resolve_series(free_text, codes=indicator_codes).set_axis(self.merged.index))
+        )
+        
+        review = resolver.review_table()
+        uncoded = self.merged["target_code"].isna().sum()
+        print(f"Names resolved ({len(review)} for review, {uncoded} impact targets without a code).")
+        
+        return review
+    
+    
     # -----------------------------
     # 3. Build Association Matrix
     # -----------------------------
@@ -79,12 +111,44 @@ class EventImpactModel:
       )
         
         self.association_matrix = matrix
+        # Impact_sheet rows averaged into each cell
+        self.impact_counts = self.merged.pivot_table(
+            index="indicator_event",
+            columns="pillar_impact",
+            values="impact_estimate_impact",
+            aggfunc="count"
+        )
         
         print("Association matrix created.")
         
         return matrix
     
     
+    def build_lag_matrix(self):
+        """
+        Create event-indicator lag table (months) and event dates
+        """
+        
+        # only rows with an impact estimate carry a lag that is applied
+        matrix = self.merged.dropna(subset=["impact_estimate_impact"]).pivot_table(
+            index="indicator_event",
+            columns="pillar_impact",
+            values="lag_months_impact",
+            aggfunc="mean"
+        )
+        
+        self.lag_matrix = matrix
+        self.event_dates = (
+            self.merged.dropna(subset=["indicator_event"])
+            .groupby("indicator_event")["observation_date_event"]
+            .first()
+        )
+        
+        print("Lag matrix created.")
+        
+        return matrix
+    
+    
     # -----------------------------
     # 4. Plot Heatmap
     # -----------------------------
@@ -93,6 +157,9 @@ class EventImpactModel:
         """
         Visualize association matrix
         """
+        # plotting libraries are imported lazily so headless runs start fast
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         
         plt.figure(figsize=(12, 6))
         sns.heatmap(
@@ -146,6 +213,7 @@ class EventImpactModel:
         """
         Compare predicted vs observed trends
         """
+        import matplotlib.pyplot as plt
         
         obs = self.observations[
             self.observations["indicator_code"] == indicator_code
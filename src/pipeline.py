@@ -0,0 +1,309 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from src.model import EventImpactModel
+from src.forecasting import AccessUsageForecaster
+from src.drivers import DriverModel
+from src.resolver import IndicatorResolver, normalize_name, target_text
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = PROJECT_ROOT / "data"
+
+# Event sets used in notebooks/forcasting.ipynb
+DEFAULT_FORECAST_SPECS = {
+    "ACCESS": ["Telebirr Launch", "Safaricom Ethiopia Commercial Launch"],
+    "USAGE": ["Telebirr Launch", "M-Pesa EthSwitch Integration"],
+}
+
+
+def _sha256(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _code_hash(objects):
+    sources = []
+    for obj in objects:
+        try:
+            sources.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            sources.append(repr(obj))
+    return _sha256(*sources)
+
+
+class Pipeline:
+    """
+    Incremental DAG of derived artifacts.
+
+    Each stage is keyed by the hash of its code, parameters and the content
+    hashes of its inputs. Outputs are pickled under their own content hash,
+    so a stage re-runs only when something upstream really changed, and an
+    unchanged output stops the rebuild from propagating further.
+    """
+
+    def __init__(self, cache_dir=DATA_DIR / ".cache"):
+        self.cache_dir = Path(cache_dir)
+        self.inputs = {}
+        self.stages = {}
+        self.status = {}
+
+    # -----------------------------
+    # 1. Define Graph
+    # -----------------------------
+
+    def add_input(self, name, path):
+        """
+        Register a raw file; its bytes are hashed on every run
+        """
+        self.inputs[name] = Path(path)
+        return self
+
+    def add_stage(self, name, func, deps=(), code=(), params=None):
+        """
+        Register func(*dep_outputs, **params); code lists extra objects
+        (classes, functions) whose source is part of the stage version
+        """
+        for dep in deps:
+            if dep not in self.inputs and dep not in self.stages:
+                raise ValueError(f"Stage '{name}' depends on unknown node '{dep}'")
+        self.stages[name] = {
+            "func": func,
+            "deps": tuple(deps),
+            "code_hash": _code_hash((func, *code)),
+            "params": params or {},
+        }
+        return self
+
+    # -----------------------------
+    # 2. Cache
+    # -----------------------------
+
+    def _object_path(self, digest):
+        return self.cache_dir / "objects" / f"{digest}.pkl"
+
+    def _key_path(self, key):
+        return self.cache_dir / "stages" / key
+
+    def _store(self, value):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = _sha256(blob)
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # unique temp name so processes sharing the cache never collide
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+                tmp.write(blob)
+            os.replace(tmp.name, path)
+        return digest
+
+    def _lookup(self, key):
+        key_path = self._key_path(key)
+        if not key_path.exists():
+            return None
+        digest = key_path.read_text().strip()
+        if not self._object_path(digest).exists():
+            return None
+        return digest
+
+    def _load(self, digest):
+        with open(self._object_path(digest), "rb") as f:
+            return pickle.load(f)
+
+    # -----------------------------
+    # 3. Run
+    # -----------------------------
+
+    def _required(self, targets):
+        required = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in required:
+                continue
+            required.add(name)
+            if name in self.stages:
+                stack.extend(self.stages[name]["deps"])
+        return required
+
+    def run(self, targets=None):
+        """
+        Bring targets (default: every stage) up to date and return their outputs
+        """
+        targets = list(self.stages) if targets is None else list(targets)
+        required = self._required(targets)
+
+        digests = {}
+        for name, path in self.inputs.items():
+            if name in required:
+                digests[name] = _sha256(path.read_bytes())
+
+        values = {}
+
+        def value(name):
+            if name not in values:
+                if name in self.inputs:
+                    values[name] = pd.read_csv(self.inputs[name])
+                else:
+                    values[name] = self._load(digests[name])
+            return values[name]
+
+        self.status = {}
+        # stages are registered after their dependencies, so insertion order is topological
+        for name, stage in self.stages.items():
+            if name not in required:
+                continue
+            key = _sha256(
+                name,
+                stage["code_hash"],
+                json.dumps(stage["params"], sort_keys=True, default=str),
+                *(digests[dep] for dep in stage["deps"]),
+            )
+            digest = self._lookup(key)
+            if digest is not None:
+                self.status[name] = "cached"
+            else:
+                values[name] = stage["func"](*[value(dep) for dep in stage["deps"]], **stage["params"])
+                digest = self._store(values[name])
+                key_path = self._key_path(key)
+                key_path.parent.mkdir(parents=True, exist_ok=True)
+                key_path.write_text(digest)
+                self.status[name] = "computed"
+            digests[name] = digest
+
+        return {name: value(name) for name in targets}
+
+    def report(self):
+        """
+        Print which stages were recomputed on the last run
+        """
+        for name, state in self.status.items():
+            print(f"{name:<22} {state}")
+
+
+# -----------------------------
+# Stage functions
+# -----------------------------
+
+def split_records(data):
+    """
+    Parse dates and split events / observations
+    """
+    model = EventImpactModel(data, pd.DataFrame())
+    model.prepare_data()
+    return {"data": model.data, "events": model.events, "observations": model.observations}
+
+
+def merge_impacts(records, impact_link):
+    """
+    Join impact links onto their parent events
+    """
+    model = EventImpactModel(records["data"], impact_link)
+    model.events = records["events"]
+    model.merge_event_impacts()
+    return model.merged
+
+
+def resolve_impacts(records, impact_link, merged, alias_path):
+    """
+    Canonical event names and impact target codes; the alias table at
+    alias_path is loaded first and saved back with newly learned aliases
+    """
+    resolver = IndicatorResolver.from_records(records["data"], impact_link, alias_path=alias_path)
+    model = EventImpactModel(pd.DataFrame(), pd.DataFrame())
+    model.merged = merged.copy()
+    model.resolve_names(resolver)
+    resolver.save_aliases(alias_path)
+    return model.merged
+
+
+def association_tables(merged):
+    """
+    Event x pillar impact and lag tables
+    """
+    model = EventImpactModel(pd.DataFrame(), pd.DataFrame())
+    model.merged = merged
+    model.build_association_matrix()
+    model.build_lag_matrix()
+    return {
+        "association_matrix": model.association_matrix,
+        "impact_counts": model.impact_counts,
+        "lag_matrix": model.lag_matrix,
+        "event_dates": model.event_dates,
+    }
+
+
+def run_forecasts(records, tables, forecast_specs, start_year=2025, end_year=2027):
+    """
+    Forecast each indicator with its event set
+    """
+    forecaster = AccessUsageForecaster(records["data"], tables["association_matrix"])
+    return {
+        indicator: forecaster.forecast(indicator, events, start_year, end_year)
+        for indicator, events in forecast_specs.items()
+    }
+
+
+def dashboard_artifacts(tables, forecasts):
+    """
+    Objects loaded by dashboard/app.py
+    """
+    return {
+        "forecasts": {indicator: result["scenarios"] for indicator, result in forecasts.items()},
+        "association_matrix": tables["association_matrix"],
+    }
+
+
+def build_pipeline(data_path=DATA_DIR / "raw" / "ethiopia_fi_unified_data.csv",
+                   impact_path=DATA_DIR / "raw" / "Impact_sheet.csv",
+                   cache_dir=DATA_DIR / ".cache",
+                   forecast_specs=None, start_year=2025, end_year=2027,
+                   alias_path=DATA_DIR / "aliases.csv"):
+    """
+    ingest -> events/observations split -> impact merge -> name resolution
+    -> association matrix -> forecasts -> dashboard artifacts
+
+    The alias table is a side output of the resolve stage, not a hashed
+    input: hand edits apply the next time that stage re-runs.
+    """
+    pipeline = Pipeline(cache_dir)
+    pipeline.add_input("data", data_path)
+    pipeline.add_input("impact_link", impact_path)
+    pipeline.add_stage("records", split_records, deps=["data"], code=[EventImpactModel])
+    pipeline.add_stage("merged", merge_impacts, deps=["records", "impact_link"], code=[EventImpactModel])
+    pipeline.add_stage(
+        "resolved", resolve_impacts, deps=["records", "impact_link", "merged"],
+        code=[EventImpactModel, IndicatorResolver, normalize_name, target_text], params={"alias_path": str(alias_path)},
+    )
+    pipeline.add_stage("tables", association_tables, deps=["resolved"], code=[EventImpactModel])
+    pipeline.add_stage(
+        "forecasts", run_forecasts, deps=["records", "tables"], code=[AccessUsageForecaster, DriverModel],
+        params={
+            "forecast_specs": forecast_specs or DEFAULT_FORECAST_SPECS,
+            "start_year": start_year,
+            "end_year": end_year,
+        },
+    )
+    pipeline.add_stage("dashboard", dashboard_artifacts, deps=["tables", "forecasts"])
+    return pipeline
+
+
+def write_dashboard_artifacts(artifacts, out_dir=DATA_DIR):
+    """
+    Write forecasts.pkl and association_matrix.pkl for dashboard/app.py
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    pd.to_pickle(artifacts["forecasts"], out_dir / "forecasts.pkl")
+    pd.to_pickle(artifacts["association_matrix"], out_dir / "association_matrix.pkl")
+    print(f"Dashboard artifacts written to {out_dir}.")
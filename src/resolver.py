@@ -0,0 +1,215 @@
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import pandas as pd
+
+
+def normalize_name(text):
+    """
+    Lowercase, drop punctuation and collapse whitespace
+    """
+    text = re.sub(r"[^0-9a-z]+", " ", str(text).lower())
+    return " ".join(text.split())
+
+
+def target_text(text):
+    """
+    'Telebirr effect on Account Ownership' -> 'Account Ownership'
+    """
+    parts = re.split(r"\beffect on\b", str(text), maxsplit=1, flags=re.IGNORECASE)
+    return parts[-1].strip()
+
+
+def _grams(name, n=3):
+    padded = f"  {name} "
+    return {padded[i:i+n] for i in range(len(padded) - n + 1)}
+
+
+class IndicatorResolver:
+    """
+    Map free-text indicator/event names to canonical codes.
+
+    Known names (and the codes themselves) live in an alias table and resolve
+    by exact lookup. Anything else goes through a blocking index of character
+    trigrams and word tokens: only codes sharing rare keys with the query are
+    scored, so resolution cost grows with block size rather than with the
+    number of known names. Confident fuzzy matches are added to the alias
+    table; low or near-tied scores are kept in `review` instead.
+    """
+
+    ALIAS_COLUMNS = ['alias', 'indicator_code', 'score', 'method']
+
+    def __init__(self, canonical, aliases=None, code_types=None, min_score=0.6, margin=0.05, max_block=200, max_candidates=25):
+        # canonical: {code: display name}; code_types: {code: record_type}
+        self.canonical = dict(canonical)
+        self.code_types = dict(code_types or {})
+        self.min_score = min_score
+        self.margin = margin
+        self.max_block = max_block
+        self.max_candidates = max_candidates
+
+        self.aliases = {}
+        self._names = defaultdict(set)       # code -> normalized names
+        self._index = defaultdict(set)       # blocking key -> codes
+        for code, name in self.canonical.items():
+            self.add_alias(code, code, 1.0, 'code')
+            self.add_alias(name, code, 1.0, 'canonical')
+        if aliases is not None:
+            for row in aliases.itertuples(index=False):
+                self.add_alias(row.alias, row.indicator_code, row.score, row.method)
+
+        self.review = []
+
+    # -----------------------------
+    # 1. Build
+    # -----------------------------
+
+    @classmethod
+    def from_records(cls, data, impact_link=None, alias_path=None, **kwargs):
+        """
+        Canonical codes from rows carrying indicator_code; impact links add
+        their '<event> effect on <target>' text as aliases of related_indicator
+        """
+        coded = data.dropna(subset=['indicator', 'indicator_code'])
+        canonical = (
+            coded.groupby('indicator_code')['indicator']
+            .agg(lambda names: names.value_counts().index[0])
+            .to_dict()
+        )
+        code_types = coded.groupby('indicator_code')['record_type'].first().to_dict()
+        aliases = cls.load_aliases(alias_path) if alias_path else None
+        resolver = cls(canonical, aliases=aliases, code_types=code_types, **kwargs)
+
+        for name, code in coded[['indicator', 'indicator_code']].drop_duplicates().itertuples(index=False):
+            resolver.add_alias(name, code, 1.0, 'observed')
+        if impact_link is not None:
+            links = impact_link.dropna(subset=['indicator', 'related_indicator'])
+            for text, code in links[['indicator', 'related_indicator']].drop_duplicates().itertuples(index=False):
+                if code in resolver.canonical:
+                    resolver.add_alias(target_text(text), code, 1.0, 'impact_link')
+        return resolver
+
+    def add_alias(self, alias, code, score=1.0, method='manual'):
+        key = normalize_name(alias)
+        if not key or key in self.aliases:
+            return
+        self.aliases[key] = {'indicator_code': code, 'score': float(score), 'method': method}
+        if key not in self._names[code]:
+            self._names[code].add(key)
+            for block in _grams(key) | set(key.split()):
+                self._index[block].add(code)
+
+    # -----------------------------
+    # 2. Resolve
+    # -----------------------------
+
+    def _score(self, query, code):
+        q_grams, q_tokens = _grams(query), set(query.split())
+        best = 0.0
+        for name in self._names[code]:
+            n_grams, n_tokens = _grams(name), set(name.split())
+            dice = 2 * len(q_grams & n_grams) / (len(q_grams) + len(n_grams))
+            containment = len(q_tokens & n_tokens) / len(q_tokens) if q_tokens else 0.0
+            best = max(best, 0.5 * dice + 0.5 * containment)
+        return best
+
+    def codes_of_type(self, *record_types):
+        """
+        Codes whose rows have one of record_types (e.g. 'event')
+        """
+        return {code for code, kind in self.code_types.items() if kind in record_types}
+
+    def candidates(self, query, codes=None):
+        """
+        Codes sharing blocking keys with query, most shared keys first;
+        codes restricts the search to one namespace (e.g. events only)
+        """
+        keys = _grams(query) | set(query.split())
+        postings = [self._index[k] for k in keys if k in self._index]
+        if codes is not None:
+            postings = [p & codes for p in postings]
+        postings = [p for p in postings if p]
+        selective = [p for p in postings if len(p) <= self.max_block] or postings
+        counts = Counter(code for posting in selective for code in posting)
+        return [code for code, _ in counts.most_common(self.max_candidates)]
+
+    def resolve(self, name, codes=None):
+        """
+        Canonical code for name (within codes, if given), or None when
+        unmatched/ambiguous
+        """
+        if pd.isna(name):
+            return None
+        query = normalize_name(name)
+        if query in self.aliases:
+            code = self.aliases[query]['indicator_code']
+            if codes is None or code in codes:
+                return code
+
+        scored = sorted(
+            ((self._score(query, code), code) for code in self.candidates(query, codes)),
+            reverse=True
+        )
+        best_score, best = scored[0] if scored else (0.0, None)
+        runner_score, runner = scored[1] if len(scored) > 1 else (0.0, None)
+
+        if best is None or best_score < self.min_score:
+            reason = 'low_score'
+        elif best_score - runner_score < self.margin:
+            reason = 'close_runner_up'
+        else:
+            self.add_alias(name, best, best_score, 'fuzzy')
+            return best
+
+        self.review.append({
+            'name': name, 'reason': reason,
+            'best_code': best, 'best_score': best_score,
+            'runner_up_code': runner, 'runner_up_score': runner_score,
+        })
+        return None
+
+    def resolve_series(self, names, codes=None):
+        """
+        Resolve each distinct value once and map back
+        """
+        mapping = {name: self.resolve(name, codes) for name in pd.Series(names).dropna().unique()}
+        return pd.Series(names).map(mapping)
+
+    def canonicalize(self, names, codes=None):
+        """
+        Replace names by the display name of their code; unresolved names are kept
+        """
+        names = pd.Series(names)
+        resolved = self.resolve_series(names, codes)
+        return resolved.map(self.canonical).fillna(names)
+
+    def review_table(self):
+        """
+        Ambiguous or unmatched names for manual review
+        """
+        return pd.DataFrame(self.review).drop_duplicates(subset=['name'])
+
+    # -----------------------------
+    # 3. Persist
+    # -----------------------------
+
+    def alias_table(self):
+        table = pd.DataFrame(
+            [{'alias': alias, **entry} for alias, entry in self.aliases.items()],
+            columns=self.ALIAS_COLUMNS
+        )
+        return table.sort_values(['indicator_code', 'alias']).reset_index(drop=True)
+
+    def save_aliases(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.alias_table().to_csv(path, index=False)
+        print(f"Alias table saved to {path}.")
+
+    @classmethod
+    def load_aliases(cls, path):
+        path = Path(path)
+        if not path.exists():
+            return None
+        return pd.read_csv(path)
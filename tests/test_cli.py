@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.__main__ import load_specs, main
+
+
+RAW = Path(__file__).resolve().parents[1] / "data" / "raw"
+
+
+def run_cli(tmp_path, config):
+    config_path = tmp_path / "runs.json"
+    config_path.write_text(json.dumps(config))
+    return main([
+        "--config", str(config_path),
+        "--data", str(RAW / "ethiopia_fi_unified_data.csv"),
+        "--impact", str(RAW / "Impact_sheet.csv"),
+        "--cache-dir", str(tmp_path / ".cache"),
+        "--aliases", str(tmp_path / "aliases.csv"),
+        "--output-dir", str(tmp_path / "outputs"),
+        "--workers", "1",
+    ])
+
+
+def test_load_specs_expands_event_sets():
+    specs = load_specs({
+        "end_year": 2028,
+        "event_sets": {"mm": ["Telebirr Launch"]},
+        "specs": [{"indicator": "USAGE", "event_set": "mm"}, {"indicator": "ACCESS"}],
+    })
+    assert specs[0]["events"] == ["Telebirr Launch"]
+    assert "event_set" not in specs[0]
+    assert [spec["name"] for spec in specs] == ["usage_0", "access_1"]
+    assert specs[1]["events"] == []
+    assert specs[1]["end_year"] == 2028
+
+
+@pytest.mark.parametrize("config, message", [
+    ({"specs": [{"indicator": "USAGE", "event_set": "missing"}]}, "unknown event_set"),
+    ({"specs": [{"name": "a", "indicator": "USAGE"}, {"name": "a", "indicator": "ACCESS"}]}, "unique"),
+    ({"specs": [{"events": []}]}, "no 'indicator'"),
+    ({"spec": [{"indicator": "USAGE"}]}, "unknown keys"),
+    ({"specs": []}, "no 'specs'"),
+    ({}, "no 'specs'"),
+])
+def test_load_specs_rejects_bad_config(config, message):
+    with pytest.raises(ValueError, match=message):
+        load_specs(config)
+
+
+def test_main_writes_artifacts(tmp_path):
+    config = {
+        "start_year": 2025,
+        "end_year": 2027,
+        "specs": [
+            {"name": "usage_tb", "indicator": "USAGE", "events": ["Telebirr Launch"], "scenarios": ["Base", "Optimistic"]},
+            {"name": "access_stress", "indicator": "ACCESS", "events": ["Telebirr Launch"], "scenarios": {"Stress": 0.25}},
+        ],
+    }
+    assert run_cli(tmp_path, config) == 0
+    out = tmp_path / "outputs"
+
+    forecast = pd.read_csv(out / "usage_tb" / "forecast.csv")
+    assert forecast["fiscal_year"].tolist() == [2025, 2026, 2027]
+    scenarios = pd.read_csv(out / "usage_tb" / "scenarios.csv")
+    assert set(scenarios["scenario"]) == {"Base", "Optimistic"}
+
+    stress = pd.read_csv(out / "access_stress" / "scenarios.csv")
+    assert set(stress["scenario"]) == {"Stress"}
+    # a 0.25 scaling keeps a quarter of the Base event effect
+    base = pd.read_csv(out / "access_stress" / "forecast.csv")
+    effect = stress["value_with_events"].values - base["trend_value"].values
+    full = pd.read_pickle(tmp_path / "outputs" / "association_matrix.pkl").loc["Telebirr Launch", "ACCESS"]
+    assert effect == pytest.approx([0.25 * full] * 3)
+
+    manifest = json.loads((out / "manifest.json").read_text())
+    assert [run["name"] for run in manifest["runs"]] == ["usage_tb", "access_stress"]
+    assert (out / "association_matrix.pkl").exists()
+
+
+@pytest.mark.parametrize("spec, message", [
+    ({"name": "typo", "indicator": "USAGE", "events": ["Telebir Launch"]}, "Spec 'typo' has unknown events"),
+    ({"name": "bad_ind", "indicator": "SAVINGS"}, "Spec 'bad_ind' has unknown indicator"),
+])
+def test_main_rejects_unknown_names_before_running(tmp_path, spec, message):
+    with pytest.raises(ValueError, match=message):
+        run_cli(tmp_path, {"specs": [spec]})
+    assert not (tmp_path / "outputs").exists()
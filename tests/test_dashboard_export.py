@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "dashboard"))
+
+from export import export_dashboard  # noqa: E402
+from views import overview_metrics, trend_series  # noqa: E402
+
+
+def load_data():
+    return pd.read_csv(ROOT / "data" / "raw" / "ethiopia_fi_unified_data.csv")
+
+
+def forecasts():
+    frame = pd.DataFrame({"fiscal_year": [2025, 2026], "value_with_events": [55.0, 58.0]})
+    return {"ACCESS": {s: frame for s in ["Base", "Optimistic", "Pessimistic"]}}
+
+
+def test_views_read_repo_indicators():
+    data = load_data()
+    assert overview_metrics(data)["ACCESS"]["latest"] == 49
+    assert list(trend_series(data, "ACCESS").index) == [2014, 2017, 2021, 2024]
+
+
+def test_export_renders_trends_and_prunes_stale_pages(tmp_path):
+    data = load_data()
+    export_dashboard(data, forecasts(), tmp_path, workers=1)
+    assert (tmp_path / "trends" / "ACCESS_2014_2024.html").exists()
+
+    rendered, skipped = export_dashboard(data, forecasts(), tmp_path, workers=1)
+    assert rendered == []
+
+    # 2014 disappears: every range touching it must be removed from the bundle
+    export_dashboard(data[data["fiscal_year"] != "2014"], forecasts(), tmp_path, workers=1)
+    assert not (tmp_path / "trends" / "ACCESS_2014_2024.html").exists()
+    assert not (tmp_path / "trends" / "ACCESS_2014_2024.json").exists()
+    assert (tmp_path / "trends" / "ACCESS_2017_2024.html").exists()
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import Ridge
+
+from src.drivers import DriverModel
+from src.forecasting import AccessUsageForecaster
+
+
+def synthetic_data(years, rng):
+    rows = []
+    for driver in ["d0", "d1"]:
+        for year in years:
+            rows.append({"indicator": driver, "observation_date": f"{year}-06-30",
+                         "fiscal_year": year, "value_numeric": rng.normal(50, 10)})
+    return pd.DataFrame(rows)
+
+
+def test_cv_results_match_explicit_leave_one_out_refit():
+    rng = np.random.default_rng(0)
+    years = np.arange(2000, 2016)
+    data = synthetic_data(np.arange(1997, 2016), rng)
+    y = rng.normal(40, 5, len(years))
+    model = DriverModel(data, drivers=["d0", "d1"], lags=(0, 1, 2), alphas=(0.01, 1.0, 100.0))
+    model.fit(years.reshape(-1, 1), y)
+
+    Z = model.lagged_design(years, 2).to_numpy(dtype=float)
+    Zs = (Z - model.z_mean_) / model.z_scale_
+    for row in model.cv_results_.itertuples():
+        k = (row.max_lag + 1) * 2
+        errors = []
+        for i in range(len(years)):
+            keep = np.arange(len(years)) != i
+            ridge = Ridge(alpha=row.alpha).fit(Zs[keep, :k], y[keep])
+            errors.append((y[i] - ridge.predict(Zs[i:i+1, :k])[0]) ** 2)
+        assert row.loo_mse == pytest.approx(np.mean(errors), rel=1e-8)
+
+
+def test_warns_when_drivers_are_held_outside_observed_years(capsys):
+    rng = np.random.default_rng(1)
+    data = synthetic_data([2022, 2024], rng)
+    model = DriverModel(data, drivers=["d0", "d1"], lags=(0,))
+    model.fit(np.array([[2014], [2017], [2021], [2024]]), np.array([22.0, 35.0, 46.0, 49.0]))
+    assert "held constant" in capsys.readouterr().out
+
+    paths = pd.DataFrame({"d0": [10.0, 60.0], "d1": [5.0, 70.0]}, index=[2010, 2030])
+    model = DriverModel(data, drivers=["d0", "d1"], lags=(0,), driver_paths=paths)
+    model.fit(np.array([[2014], [2017], [2021], [2024]]), np.array([22.0, 35.0, 46.0, 49.0]))
+    model.predict(np.array([[2025], [2027]]))
+    assert "held constant" not in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("kwargs", [{"trend": "driver"}, {"interval": "boostrap"}])
+def test_forecast_rejects_unknown_options(kwargs):
+    data = pd.DataFrame({"indicator": ["Account Ownership Rate"] * 2, "fiscal_year": [2014, 2017],
+                         "value_numeric": [22, 35]})
+    assoc = pd.DataFrame({"ACCESS": [1.0]}, index=pd.Index(["e"], name="indicator_event"))
+    with pytest.raises(ValueError):
+        AccessUsageForecaster(data, assoc).forecast("ACCESS", ["e"], **kwargs)
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.model import EventImpactModel
+from src.forecasting import AccessUsageForecaster, bootstrap_trend_intervals
+
+
+RAW = Path(__file__).resolve().parents[1] / "data" / "raw"
+
+
+def build_forecaster(impact_link):
+    data = pd.read_csv(RAW / "ethiopia_fi_unified_data.csv")
+    model = EventImpactModel(data, impact_link)
+    model.prepare_data()
+    model.merge_event_impacts()
+    model.build_association_matrix()
+    model.build_lag_matrix()
+    return AccessUsageForecaster(
+        data, model.association_matrix,
+        lag_matrix=model.lag_matrix, event_dates=model.event_dates,
+        impact_counts=model.impact_counts,
+    )
+
+
+def test_lag_matrix_ignores_rows_without_impact():
+    impact = pd.read_csv(RAW / "Impact_sheet.csv")
+    forecaster = build_forecaster(impact)
+    # Telebirr/USAGE: (NaN, lag 3) and (25, lag 6) -> only the 6-month row counts
+    assert forecaster.lag_matrix.loc["Telebirr Launch", "USAGE"] == 6
+
+
+def test_sensitivity_matches_finite_difference_per_impact_row():
+    impact = pd.read_csv(RAW / "Impact_sheet.csv")
+    events = ["Telebirr Launch", "M-Pesa EthSwitch Integration", "EthioPay Instant Payment System Launch"]
+    base = build_forecaster(impact)
+    jac = base.sensitivity(events, indicators=["USAGE"], start_year=2024, end_year=2027)["impact"]
+    base_result = base.forecast("USAGE", events, 2024, 2027)
+
+    # every Impact_sheet USAGE row of these events, one at a time
+    parents = {"EVT_0001": events[0], "EVT_0007": events[1], "EVT_0008": events[2]}
+    rows = impact.index[(impact["pillar"] == "USAGE") & impact["impact_estimate"].notna()]
+    rows = [r for r in rows if impact.loc[r, "parent_id"] in parents]
+    assert len(rows) >= 3
+    for r in rows:
+        event = parents[impact.loc[r, "parent_id"]]
+        bumped = impact.copy()
+        bumped.loc[r, "impact_estimate"] += 1.0
+        result = build_forecaster(bumped).forecast("USAGE", events, 2024, 2027)
+        for scenario, df in result["scenarios"].items():
+            diff = df["value_with_events"].values - base_result["scenarios"][scenario]["value_with_events"].values
+            expected = jac.loc[(scenario, "USAGE"), event].values
+            np.testing.assert_allclose(diff, expected, atol=1e-9)
+
+
+def test_sensitivity_is_per_row_for_averaged_cells():
+    impact = pd.read_csv(RAW / "Impact_sheet.csv")
+    forecaster = build_forecaster(impact)
+    jac = forecaster.sensitivity(["M-Pesa EthSwitch Integration"], indicators=["USAGE"], start_year=2027, end_year=2027)
+    # two Impact_sheet rows (15 and 10) are averaged into the cell
+    assert jac["rows_per_cell"].loc["USAGE", "M-Pesa EthSwitch Integration"] == 2
+    assert jac["impact"].loc[("Base", "USAGE", 2027), "M-Pesa EthSwitch Integration"] == 0.5
+
+
+def synthetic_history(n_series, years, rng, noise=2.0):
+    slopes = rng.uniform(0.5, 3.0, n_series)
+    values = 20 + slopes[None, :] * (years[:, None] - years[0]) + rng.normal(0, noise, (len(years), n_series))
+    return pd.DataFrame(values, index=years), slopes
+
+
+def test_bootstrap_band_widens_with_horizon():
+    rng = np.random.default_rng(0)
+    years = np.arange(2011, 2025)
+    hist, _ = synthetic_history(50, years, rng)
+    bands = bootstrap_trend_intervals(hist, np.arange(2025, 2036), n_boot=1000, random_state=1)
+    width = (bands["ci_upper"] - bands["ci_lower"]).to_numpy().reshape(50, -1).mean(axis=0)
+    assert np.all(np.diff(width) > 0)
+
+
+def test_bootstrap_coverage_on_synthetic_series():
+    rng = np.random.default_rng(2)
+    years = np.arange(2011, 2025)
+    n_series, noise = 400, 2.0
+    hist, slopes = synthetic_history(n_series, years, rng, noise)
+    bands = bootstrap_trend_intervals(hist, [2026], n_boot=1000, level=0.9, random_state=3)
+    truth = 20 + slopes * (2026 - years[0]) + rng.normal(0, noise, n_series)
+    covered = (bands["ci_lower"].values <= truth) & (truth <= bands["ci_upper"].values)
+    assert 0.84 <= covered.mean() <= 0.96
+
+
+def test_bootstrap_flags_series_with_too_few_years():
+    hist = pd.DataFrame({"short": [40.0, 50.0, np.nan], "long": [40.0, 52.0, 59.0]}, index=[2014, 2017, 2021])
+    bands = bootstrap_trend_intervals(hist, [2025, 2026], n_boot=200, random_state=0).set_index("series")
+    assert bands.loc["short", "ci_lower"].isna().all()
+    assert bands.loc["short", "trend_value"].notna().all()
+    assert (bands.loc["long", "ci_upper"] > bands.loc["long", "ci_lower"]).all()
@@ -0,0 +1,70 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from src.pipeline import build_pipeline
+
+
+RAW = Path(__file__).resolve().parents[1] / "data" / "raw"
+
+
+def make_pipeline(tmp_path):
+    return build_pipeline(
+        tmp_path / "raw" / "ethiopia_fi_unified_data.csv",
+        tmp_path / "raw" / "Impact_sheet.csv",
+        tmp_path / ".cache",
+        alias_path=tmp_path / "aliases.csv",
+    )
+
+
+def test_impact_edit_only_rebuilds_downstream_stages(tmp_path):
+    shutil.copytree(RAW, tmp_path / "raw")
+
+    pipeline = make_pipeline(tmp_path)
+    first = pipeline.run()
+    assert set(pipeline.status.values()) == {"computed"}
+
+    pipeline = make_pipeline(tmp_path)
+    pipeline.run()
+    assert set(pipeline.status.values()) == {"cached"}
+
+    impact = pd.read_csv(tmp_path / "raw" / "Impact_sheet.csv")
+    impact.loc[0, "impact_estimate"] += 1
+    impact.to_csv(tmp_path / "raw" / "Impact_sheet.csv", index=False)
+
+    pipeline = make_pipeline(tmp_path)
+    second = pipeline.run()
+    assert pipeline.status["records"] == "cached"
+    assert pipeline.status["merged"] == "computed"
+    assert pipeline.status["resolved"] == "computed"
+    assert pipeline.status["tables"] == "computed"
+    assert pipeline.status["forecasts"] == "computed"
+    assert not first["tables"]["association_matrix"].equals(second["tables"]["association_matrix"])
+
+
+def test_cache_leaves_no_temp_files(tmp_path):
+    shutil.copytree(RAW, tmp_path / "raw")
+    make_pipeline(tmp_path).run()
+    assert not list((tmp_path / ".cache").rglob("*.tmp"))
+
+
+def test_near_duplicate_event_names_share_one_row(tmp_path):
+    shutil.copytree(RAW, tmp_path / "raw")
+    data = pd.read_csv(tmp_path / "raw" / "ethiopia_fi_unified_data.csv")
+    impact = pd.read_csv(tmp_path / "raw" / "Impact_sheet.csv")
+
+    # a second, uncoded record of the Telebirr event under a slightly different name
+    telebirr = data[data["indicator_code"] == "EVT_TELEBIRR"].iloc[[0]].copy()
+    telebirr[["record_id", "indicator", "indicator_code"]] = ["EVT_9999", "Telebirr launch.", None]
+    pd.concat([data, telebirr]).to_csv(tmp_path / "raw" / "ethiopia_fi_unified_data.csv", index=False)
+    row = impact.index[impact["parent_id"] == data.loc[telebirr.index[0], "record_id"]][0]
+    impact.loc[row, "parent_id"] = "EVT_9999"
+    impact.to_csv(tmp_path / "raw" / "Impact_sheet.csv", index=False)
+
+    outputs = make_pipeline(tmp_path).run(targets=["tables"])
+    matrix = outputs["tables"]["association_matrix"]
+    assert "Telebirr Launch" in matrix.index
+    assert "Telebirr launch." not in matrix.index
+    aliases = pd.read_csv(tmp_path / "aliases.csv")
+    assert "telebirr launch" in set(aliases["alias"])
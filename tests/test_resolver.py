@@ -0,0 +1,77 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.model import EventImpactModel
+from src.resolver import IndicatorResolver, normalize_name
+
+
+RAW = Path(__file__).resolve().parents[1] / "data" / "raw"
+
+
+def build_resolver(**kwargs):
+    data = pd.read_csv(RAW / "ethiopia_fi_unified_data.csv")
+    impact = pd.read_csv(RAW / "Impact_sheet.csv")
+    return IndicatorResolver.from_records(data, impact, **kwargs)
+
+
+def test_blocking_skips_common_keys():
+    # every name shares the 'rate' keys; only the rare 'zebra' keys should block
+    canonical = {f"IND_{i:03d}": f"indicator {i:03d} rate" for i in range(300)}
+    canonical["IND_ZEBRA"] = "zebra crossing rate"
+    resolver = IndicatorResolver(canonical, max_block=200)
+
+    candidates = resolver.candidates(normalize_name("zebra crosing rate"))
+    assert candidates[0] == "IND_ZEBRA"
+    assert len(candidates) < 10
+    assert resolver.resolve("zebra crosing rate") == "IND_ZEBRA"
+
+
+def test_near_tie_goes_to_review():
+    resolver = IndicatorResolver({"A": "mobile money account rate", "B": "mobile money activity rate"})
+
+    assert resolver.resolve("mobile money acc rate") is None
+    review = resolver.review_table()
+    assert review["reason"].tolist() == ["close_runner_up"]
+    assert set(review[["best_code", "runner_up_code"]].iloc[0]) == {"A", "B"}
+    # ambiguous names are not learned as aliases
+    assert "mobile money acc rate" not in resolver.aliases
+
+
+def test_alias_round_trip(tmp_path):
+    resolver = IndicatorResolver({"ACC_OWNERSHIP": "Account Ownership Rate"})
+    assert resolver.resolve("Acount Ownership Rate") == "ACC_OWNERSHIP"
+    path = tmp_path / "aliases.csv"
+    resolver.save_aliases(path)
+
+    reloaded = IndicatorResolver({}, aliases=IndicatorResolver.load_aliases(path))
+    assert reloaded.aliases["acount ownership rate"]["method"] == "fuzzy"
+    # exact lookup, no candidates to score
+    assert reloaded.resolve("Acount Ownership Rate") == "ACC_OWNERSHIP"
+    assert reloaded.review == []
+    assert IndicatorResolver.load_aliases(tmp_path / "missing.csv") is None
+
+
+def test_event_names_resolve_to_events_only():
+    resolver = build_resolver()
+    events = resolver.codes_of_type("event")
+    assert events and all(code.startswith("EVT_") for code in events)
+
+    name = "Fayda Digital ID Enrollment Rollout"
+    assert resolver.canonicalize([name], codes=events).tolist() == ["Fayda Digital ID Program Rollout"]
+    # an indicator alias does not leak into the event namespace
+    assert resolver.resolve("Fayda Digital ID Enrollment", codes=events) != resolver.resolve("Fayda Digital ID Enrollment")
+
+
+def test_resolve_names_keeps_events_and_targets_apart():
+    data = pd.read_csv(RAW / "ethiopia_fi_unified_data.csv")
+    model = EventImpactModel(data, pd.read_csv(RAW / "Impact_sheet.csv"))
+    model.prepare_data()
+    model.merge_event_impacts()
+    resolver = build_resolver()
+    model.resolve_names(resolver)
+
+    events = resolver.codes_of_type("event")
+    event_names = {resolver.canonical[code] for code in events}
+    assert set(model.merged["indicator_event"]) <= event_names
+    assert not model.merged["target_code"].dropna().isin(events).any()